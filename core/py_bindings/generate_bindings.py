@@ -12,21 +12,72 @@ Examples:
     python generate_bindings.py ../src CombatLine --namespace swtor
     python generate_bindings.py ../src Entity --namespace swtor --output ../bindings
     python generate_bindings.py ../src stat_value --namespace swtor
+
+Compiled build (optional):
+    The module is fully annotated so it can be compiled with mypyc:
+        pip install mypy
+        mypyc generate_bindings.py
+    This drops a native extension next to the script, which is picked up
+    automatically on the next run. Delete it to go back to pure Python.
 """
 
 import os
 import re
+import sys
 import argparse
+import functools
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Iterator, NamedTuple, Optional
 from pathlib import Path
 
 
+# ============================================================================
+# Precompiled Patterns
+# ============================================================================
+
+# Comments and string/char literals in one alternation, so comment markers
+# inside literals (e.g. "http://") are skipped over rather than stripped.
+# A quote right after a (hex) digit is a digit separator as in 1'000, not a
+# char literal; the other literal patterns below share this guard.
+_RE_COMMENT = re.compile(
+    r'//[^\n]*'
+    r'|/\*.*?(?:\*/|\Z)'
+    r'|"(?:\\.|[^"\\\n])*"'
+    r"|(?<![0-9A-Fa-f])'(?:\\.|[^'\\\n])*'",
+    re.DOTALL,
+)
+
+# Patterns using \w or \b are compiled with re.ASCII, C++ identifiers are ASCII
+_RE_IDENT = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]*$')
+_RE_STDFUNC = re.compile(r'std::\w+<', re.ASCII)
+_RE_SKIP_PREFIX = re.compile(r'(?:using|typedef|friend|template|return|if|for|while|switch)\b', re.ASCII)
+_RE_MODIFIERS = re.compile(r'\b(?:static|const|virtual|inline|override)\b', re.ASCII)
+_RE_TYPE_NAME = re.compile(r'[A-Za-z_][A-Za-z_0-9:]*')
+
+# String and char literals, jumped over whole when scanning for delimiters
+_RE_LITERAL = re.compile(r'"(?:\\.|[^"\\\n])*"' r"|(?<![0-9A-Fa-f])'(?:\\.|[^'\\\n])*'")
+
+# One pass over a file finds namespace blocks, type definitions and the
+# remaining braces, which is enough to know the namespace of every type.
+# String/char literals are matched too so braces inside them are skipped.
+_RE_DECL = re.compile(
+    r'"(?:\\.|[^"\\\n])*"'
+    r"|(?<![0-9A-Fa-f])'(?:\\.|[^'\\\n])*'"
+    r'|\bnamespace\s+(?P<namespace>\w+(?:::\w+)*)\s*\{'
+    r'|\b(?P<kind>struct|class|enum)\s+(?P<scoped>class\s+)?(?P<name>\w+)\s*'
+    r'(?::\s*(?:public|private|protected)?\s*(?P<base>\w+(?:::\w+)*))?\s*\{'
+    r'|[{}]',
+    re.ASCII,
+)
+
+
 # ============================================================================
 # Data Classes
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class CppField:
     """Represents a C++ class/struct field"""
     name: str
@@ -42,12 +93,19 @@ class CppField:
     access: str = "public"  # public, private, protected
 
 
-@dataclass
+class CppParam(NamedTuple):
+    """Represents a C++ method parameter"""
+    cpp_type: str
+    name: str
+    default: Optional[str] = None
+
+
+@dataclass(slots=True)
 class CppMethod:
     """Represents a C++ class/struct method"""
     name: str
     return_type: str
-    params: list  # List of (type, name, default) tuples
+    params: list  # List of CppParam
     is_const: bool = False
     is_static: bool = False
     is_virtual: bool = False
@@ -57,7 +115,7 @@ class CppMethod:
     access: str = "public"
 
 
-@dataclass
+@dataclass(slots=True)
 class CppEnum:
     """Represents a C++ enum"""
     name: str
@@ -67,7 +125,7 @@ class CppEnum:
     namespace: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class CppClass:
     """Represents a C++ class or struct"""
     name: str
@@ -79,53 +137,415 @@ class CppClass:
     source_file: str = ""
 
 
+# ============================================================================
+# Member Tokenizer
+# ============================================================================
+
+_ACCESS_SPECIFIERS = ('public', 'private', 'protected')
+_NESTED_TYPE_KEYWORDS = ('struct', 'class', 'union', 'enum')
+_METHOD_TAIL_WORDS = ('const', 'volatile', 'noexcept', 'override', 'final')
+_KEYWORDS = frozenset({
+    'const', 'static', 'virtual', 'inline', 'explicit', 'override', 'final',
+    'public', 'private', 'protected', 'mutable', 'volatile', 'extern'
+})
+
+
+def _is_identifier(name: str) -> bool:
+    """Check that name is a plain (ASCII) C++ identifier"""
+    return name.isidentifier() and name.isascii()
+
+
+def _literal_end(s: str, i: int) -> int:
+    """Return the end of the string/char literal starting at i, or -1"""
+    match = _RE_LITERAL.match(s, i)
+    return match.end() if match else -1
+
+
+def _next_quote(s: str, pos: int) -> int:
+    """Find the next quote character at or after pos, or -1"""
+    double = s.find('"', pos)
+    single = s.find("'", pos)
+    if double == -1 or single == -1:
+        return max(double, single)
+    return min(double, single)
+
+
+def _find_closing(s: str, start: int, open_char: str, close_char: str) -> int:
+    """Find the delimiter closing the one at start, or -1 if unbalanced
+    
+    Jumps from delimiter to delimiter with str.find rather than stepping
+    through every character. String and char literals are jumped over whole.
+    """
+    depth = 1
+    pos = start + 1
+    quote = _next_quote(s, pos)
+    close = s.find(close_char, pos)
+    while close != -1:
+        if quote != -1 and quote < close:
+            nested = s.find(open_char, pos, quote)
+            if nested == -1:
+                end = _literal_end(s, quote)
+                pos = quote + 1 if end == -1 else end
+                quote = _next_quote(s, pos)
+                if close < pos:
+                    close = s.find(close_char, pos)
+                continue
+        else:
+            nested = s.find(open_char, pos, close)
+        if nested == -1:
+            depth -= 1
+            if depth == 0:
+                return close
+            pos = close + 1
+            close = s.find(close_char, pos)
+        else:
+            depth += 1
+            pos = nested + 1
+    return -1
+
+
+class CppTokenizer:
+    """Single-pass scanner that splits a class body into member statements
+    
+    Produces (kind, text) tuples where kind is 'access' (text is the access
+    level), 'field' or 'method' (text is the declaration, terminated by ';').
+    The body is expected to have its comments stripped already; preprocessor
+    lines are dropped and inline method bodies are skipped as they are
+    encountered.
+    """
+    
+    def __init__(self, body: str):
+        self.body = body
+    
+    def tokenize(self) -> Iterator[tuple]:
+        """Walk the body once, yielding (kind, text) tokens as they are found"""
+        body = self.body
+        n = len(body)
+        
+        pieces = []          # Kept slices of the current statement
+        seg = 0              # Start of the slice currently being scanned
+        blank = True         # Nothing but whitespace seen in statement
+        has_paren = False    # A '(' was seen outside initializer braces
+        after_paren = False  # Last tokens were ')' and trailing specifiers
+        trailing = False     # Inside a trailing return type `) -> int`
+        init_list = False    # Inside a constructor initializer list `) : x(0)`
+        depth = 0            # Brace depth of field initializers like `int x{0};`
+        
+        i = 0
+        while i < n:
+            char = body[i]
+            
+            if char == '#' and blank:
+                # Preprocessor line
+                i = body.find('\n', i)
+                if i == -1:
+                    i = n
+                seg = i
+                continue
+            
+            if char == '"' or char == "'":
+                end = _literal_end(body, i)
+                if end != -1:
+                    # Delimiters inside a literal, as in `char c = '{';`, don't count
+                    i = end
+                    blank = False
+                    after_paren = False
+                    continue
+            
+            if char == ';' and depth == 0:
+                pieces.append(body[seg:i])
+                text = ''.join(pieces).strip()
+                if text:
+                    yield ('method' if has_paren else 'field', text + ';')
+                pieces = []
+                seg = i + 1
+                blank = True
+                has_paren = False
+                after_paren = False
+                trailing = False
+                init_list = False
+            elif char == '{':
+                pieces.append(body[seg:i])
+                seg = i
+                head = ''.join(pieces).strip()
+                is_method_body = depth == 0 and (after_paren or trailing)
+                first_word = head.split(None, 1)[0] if head else ''
+                is_nested_type = depth == 0 and first_word in _NESTED_TYPE_KEYWORDS
+                if is_method_body or is_nested_type:
+                    # Method body or nested type definition - skip it entirely
+                    close = _find_closing(body, i, '{', '}')
+                    i = n if close == -1 else close + 1
+                    if is_method_body:
+                        yield ('method', head + ' ;')
+                    pieces = []
+                    seg = i
+                    blank = True
+                    has_paren = False
+                    after_paren = False
+                    trailing = False
+                    init_list = False
+                    continue
+                # It's likely a field initializer - keep it
+                depth += 1
+                blank = False
+                after_paren = False
+            elif char == '}':
+                if depth > 0:
+                    depth -= 1
+                blank = False
+                # `y{1}` in an initializer list may be followed by the body
+                after_paren = init_list and depth == 0
+            elif char == ':' and depth == 0 and body[i + 1:i + 2] != ':' and body[i - 1:i] != ':':
+                pieces.append(body[seg:i])
+                text = ''.join(pieces).strip()
+                if text in _ACCESS_SPECIFIERS:
+                    yield ('access', text)
+                    pieces = []
+                    seg = i + 1
+                    blank = True
+                    i += 1
+                    continue
+                if after_paren:
+                    init_list = True
+                seg = i
+                blank = False
+                after_paren = False
+            elif char == '(':
+                if depth == 0:
+                    has_paren = True
+                blank = False
+                after_paren = False
+            elif char == ')':
+                blank = False
+                after_paren = True
+            elif after_paren and char == '-' and body[i + 1:i + 2] == '>':
+                trailing = True
+                after_paren = False
+                i += 2
+                continue
+            elif after_paren and char == '&':
+                # Ref-qualifier, as in `) const& {`
+                pass
+            elif after_paren and (char.isalpha() or char == '_'):
+                # Words after ')' keep a following '{' a method body only if
+                # they are trailing specifiers like `) const override {`
+                end = i + 1
+                while end < n and (body[end].isalnum() or body[end] == '_'):
+                    end += 1
+                after_paren = body[i:end] in _METHOD_TAIL_WORDS
+                i = end
+                continue
+            elif not char.isspace():
+                blank = False
+                after_paren = False
+            
+            i += 1
+
+
 # ============================================================================
 # C++ Parser
 # ============================================================================
 
+def _comment_replacement(match: re.Match) -> str:
+    """Drop a comment matched by _RE_COMMENT, keeping string literals"""
+    text = match.group(0)
+    if text[0] != '/':
+        return text
+    # A block comment still separates the tokens around it
+    return ' ' if text[1] == '*' else ''
+
+
+def _read_source_file(file_path: Path) -> tuple:
+    """Read a source file as text, returning (content, error)"""
+    try:
+        raw = file_path.read_bytes()
+    except Exception as e:
+        return None, e
+    # C++ sources are almost always pure ASCII, which decodes without the
+    # UTF-8 validation pass and into the compact one-byte str layout
+    content = raw.decode('ascii') if raw.isascii() else raw.decode('utf-8', errors='ignore')
+    # Normalize line endings the same way text-mode open() does
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content, None
+
+
+def _scan_declarations(content: str) -> list:
+    """Find every struct/class/enum definition in a file
+    
+    Returns (enclosing namespaces, name, start, end, kind) tuples in file order.
+    """
+    decls = []
+    scopes: list = []  # Namespace name for namespace blocks, None for other braces
+    for match in _RE_DECL.finditer(content):
+        token = match.group(0)
+        if token == '}':
+            if scopes:
+                scopes.pop()
+        elif token == '{':
+            scopes.append(None)
+        elif token[0] in '"\'':
+            continue
+        elif match.group('namespace'):
+            scopes.append(match.group('namespace'))
+        else:
+            enclosing = tuple(part for scope in scopes if scope for part in scope.split('::'))
+            decls.append((enclosing, match.group('name'), match.start(), match.end(), match.group('kind')))
+            # The definition's body is a scope of its own
+            scopes.append(None)
+    return decls
+
+
+# Bump whenever the layout or the scanning of the cached declarations changes
+_CACHE_VERSION = 3
+_CACHE_FILE = 'index.pickle'
+
+
 class CppParser:
     """Simple C++ parser for extracting struct/class definitions"""
     
     # Common C++ types that map directly to Python
-    SIMPLE_TYPES = {
+    SIMPLE_TYPES = frozenset({
         'int', 'int8_t', 'int16_t', 'int32_t', 'int64_t',
         'uint8_t', 'uint16_t', 'uint32_t', 'uint64_t',
         'float', 'double', 'bool', 'char',
         'size_t', 'ssize_t'
-    }
+    })
     
-    STRING_TYPES = {'std::string', 'string'}
-    STRING_VIEW_TYPES = {'std::string_view', 'string_view'}
+    STRING_TYPES = frozenset({'std::string', 'string'})
+    STRING_VIEW_TYPES = frozenset({'std::string_view', 'string_view'})
     
-    def __init__(self, folder_path: str):
+    def __init__(self, folder_path: str, cache_dir: Optional[str] = None, jobs: Optional[int] = None):
         self.folder_path = Path(folder_path)
-        self.files_content = {}
+        self.cache_dir = cache_dir  # Keep the declaration index here between runs
+        self.jobs = jobs
+        self.file_paths: list[str] = []
+        self.files_content: dict[str, str] = {}  # Comments stripped
+        # "ns::inner::Name" -> (file_path, start, end, kind, "ns::inner")
+        self._decl_index: dict[str, tuple] = {}
+        # name -> [declaration, ...] in directory order
+        self._decls_by_name: dict[str, list] = {}
+        self._class_cache: dict[tuple, Optional[CppClass]] = {}
+        self._enum_cache: dict[tuple, Optional[CppEnum]] = {}
         self._load_files()
     
     def _load_files(self):
         """Load all .h and .cpp files from the folder"""
         extensions = ['.h', '.hpp', '.cpp', '.cc']
-        for ext in extensions:
-            for file_path in self.folder_path.rglob(f'*{ext}'):
+        self.file_paths = [str(p) for ext in extensions for p in self.folder_path.rglob(f'*{ext}')]
+        
+        # With a cache, files whose mtime and size are unchanged reuse their
+        # declarations and are only read if a type in them is parsed
+        cached = self._load_cache() if self.cache_dir else {}
+        stamps = {}
+        decls_by_file = {}
+        to_read = []
+        for path in self.file_paths:
+            if self.cache_dir:
                 try:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        self.files_content[str(file_path)] = f.read()
-                except Exception as e:
-                    print(f"Warning: Could not read {file_path}: {e}")
+                    stat = os.stat(path)
+                except OSError:
+                    # E.g. a dangling symlink, reading it reports the error
+                    to_read.append(path)
+                    continue
+                stamps[path] = (stat.st_mtime_ns, stat.st_size)
+                entry = cached.get(path)
+                if entry and entry[0] == stamps[path]:
+                    decls_by_file[path] = entry[1]
+                    continue
+            to_read.append(path)
+        
+        # File reads release the GIL, so read in parallel; map keeps the order
+        with ThreadPoolExecutor(max_workers=self.jobs or os.cpu_count()) as executor:
+            for path, (content, error) in zip(to_read, executor.map(_read_source_file, map(Path, to_read))):
+                if error:
+                    print(f"Warning: Could not read {path}: {error}")
+                    continue
+                # Strip comments once here so nothing downstream sees them
+                clean = self._remove_comments(content)
+                self.files_content[path] = clean
+                decls_by_file[path] = _scan_declarations(clean)
+        
+        # Index in directory order, wherever the declarations came from
+        for path in self.file_paths:
+            if path in decls_by_file:
+                self._index_declarations(path, decls_by_file[path])
+        
+        if self.cache_dir and (to_read or cached.keys() != decls_by_file.keys()):
+            self._save_cache({path: (stamps[path], decls) for path, decls in decls_by_file.items() if path in stamps})
+    
+    def _load_cache(self) -> dict:
+        """Load the cached declarations, {path: ((mtime_ns, size), decls)}"""
+        import pickle  # Only needed with --incremental
+        assert self.cache_dir is not None
+        try:
+            with open(os.path.join(self.cache_dir, _CACHE_FILE), 'rb') as f:
+                version, files = pickle.load(f)
+        except Exception:
+            return {}
+        return files if version == _CACHE_VERSION else {}
+    
+    def _save_cache(self, files: dict):
+        """Write the declaration cache, replacing the old one in one step"""
+        import pickle
+        assert self.cache_dir is not None
+        cache_file = os.path.join(self.cache_dir, _CACHE_FILE)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(cache_file + '.tmp', 'wb') as f:
+                pickle.dump((_CACHE_VERSION, files), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(cache_file + '.tmp', cache_file)
+        except OSError as e:
+            print(f"Warning: Could not write cache {cache_file}: {e}")
+    
+    def _file_text(self, file_path: str) -> str:
+        """Comment-stripped text of a file, read on first use if it came from the cache"""
+        content = self.files_content.get(file_path)
+        if content is None:
+            raw, error = _read_source_file(Path(file_path))
+            if error:
+                print(f"Warning: Could not read {file_path}: {error}")
+                raw = ''
+            content = self._remove_comments(raw)
+            self.files_content[file_path] = content
+        return content
+    
+    def _index_declarations(self, file_path: str, decls: list):
+        """Record a file's struct/class/enum definitions by name and namespace"""
+        for enclosing, name, start, end, kind in decls:
+            namespace = sys.intern('::'.join(enclosing))
+            decl = (file_path, start, end, kind, namespace)
+            self._decl_index.setdefault(f'{namespace}::{name}' if namespace else name, decl)
+            self._decls_by_name.setdefault(name, []).append(decl)
+    
+    def _find_declaration(self, name: str, namespace: str, kinds: tuple) -> Optional[tuple]:
+        """Look up an indexed declaration of one of the given kinds
+        
+        The fully qualified name is tried first; otherwise the first
+        declaration nested anywhere inside the namespace (or anywhere at all
+        when no namespace is given) is used, so "inner" also finds types in
+        "outer::inner".
+        """
+        decl = self._decl_index.get(f'{namespace}::{name}' if namespace else name)
+        if decl and decl[3] in kinds:
+            return decl
+        wanted = f'::{namespace}::'
+        for decl in self._decls_by_name.get(name, ()):
+            if decl[3] in kinds and (not namespace or wanted in f'::{decl[4]}::'):
+                return decl
+        return None
     
     def _remove_comments(self, code: str) -> str:
         """Remove C++ comments from code"""
-        # Remove single-line comments but preserve them for extraction
-        code = re.sub(r'//.*$', '', code, flags=re.MULTILINE)
-        # Remove multi-line comments
-        code = re.sub(r'/\*.*?\*/', '', code, flags=re.DOTALL)
-        return code
+        if '/' not in code:
+            return code
+        return _RE_COMMENT.sub(_comment_replacement, code)
     
     def _extract_comment_above(self, code: str, pos: int) -> str:
         """Extract documentation comment above a position"""
         # Look backwards for /// or /** comments
         lines = code[:pos].split('\n')
-        comments = []
+        comments: list = []
         for line in reversed(lines[-10:]):  # Look at last 10 lines
             line = line.strip()
             if line.startswith('///'):
@@ -143,52 +563,31 @@ class CppParser:
     
     def find_class_or_struct(self, name: str, namespace: str = "") -> Optional[CppClass]:
         """Find a class or struct definition by name"""
-        for file_path, content in self.files_content.items():
-            result = self._parse_class_in_content(content, name, namespace, file_path)
-            if result:
-                return result
-        return None
+        key = (name, namespace)
+        if key not in self._class_cache:
+            decl = self._find_declaration(name, namespace, ('struct', 'class'))
+            self._class_cache[key] = self._parse_class_at(decl) if decl else None
+        return self._class_cache[key]
     
-    def _parse_class_in_content(self, content: str, name: str, namespace: str, file_path: str) -> Optional[CppClass]:
-        """Parse class/struct from file content"""
-        
-        # Build pattern to find struct/class
-        # Handles: struct Name { or class Name { or struct Name : public Base {
-        if namespace:
-            # Look inside namespace block
-            ns_pattern = rf'namespace\s+{re.escape(namespace)}\s*\{{'
-            ns_match = re.search(ns_pattern, content)
-            if not ns_match:
-                return None
-            # Find the content within this namespace (simplified - doesn't handle nested namespaces perfectly)
-            start = ns_match.end()
-            # We'll search from here
-            search_content = content[start:]
-        else:
-            search_content = content
-        
-        # Pattern for struct/class definition
-        pattern = rf'(struct|class)\s+{re.escape(name)}\s*(?::\s*(?:public|private|protected)?\s*(\w+(?:::\w+)*))?\s*\{{'
-        
-        match = re.search(pattern, search_content)
-        if not match:
-            return None
-        
-        is_struct = match.group(1) == 'struct'
-        base_class = match.group(2) if match.group(2) else None
+    def _parse_class_at(self, decl: tuple) -> Optional[CppClass]:
+        """Parse the class/struct whose definition was indexed at decl"""
+        file_path, start, end, kind, namespace = decl
+        content = self._file_text(file_path)
         
         # Find the matching closing brace
-        brace_start = match.end() - 1
-        body = self._extract_braced_content(search_content, brace_start)
-        
-        if not body:
+        body = self._extract_braced_content(content, end - 1)
+        match = _RE_DECL.match(content, start)
+        if not body or not match:
             return None
         
+        base_class = match.group('base')
+        is_struct = kind == 'struct'
+        
         cpp_class = CppClass(
-            name=name,
+            name=sys.intern(match.group('name')),
             is_struct=is_struct,
             namespace=namespace,
-            base_classes=[base_class] if base_class else [],
+            base_classes=[sys.intern(base_class)] if base_class else [],
             source_file=file_path
         )
         
@@ -199,18 +598,14 @@ class CppParser:
     
     def _extract_braced_content(self, content: str, start: int) -> Optional[str]:
         """Extract content between matching braces"""
-        if content[start] != '{':
+        # A cached declaration may point past a file that could not be read
+        if start >= len(content) or content[start] != '{':
             return None
         
-        depth = 0
-        for i in range(start, len(content)):
-            if content[i] == '{':
-                depth += 1
-            elif content[i] == '}':
-                depth -= 1
-                if depth == 0:
-                    return content[start+1:i]
-        return None
+        end = _find_closing(content, start, '{', '}')
+        if end == -1:
+            return None
+        return content[start+1:end]
     
     def _parse_members(self, body: str, cpp_class: CppClass, is_struct: bool):
         """Parse class/struct members (fields and methods)"""
@@ -218,98 +613,39 @@ class CppParser:
         # Default access for struct is public, for class is private
         current_access = "public" if is_struct else "private"
         
-        # First, remove inline method bodies (content between { })
-        # This prevents parsing string literals inside methods as fields
-        clean_body = self._remove_inline_bodies(body)
-        
-        # Split by lines for easier processing
-        lines = clean_body.split('\n')
-        
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-            
-            # Check for access specifier
-            if line.startswith('public:'):
-                current_access = 'public'
-                i += 1
-                continue
-            elif line.startswith('private:'):
-                current_access = 'private'
-                i += 1
-                continue
-            elif line.startswith('protected:'):
-                current_access = 'protected'
-                i += 1
+        # Inline method bodies and preprocessor lines are dropped by
+        # the tokenizer, so every statement here is a candidate declaration
+        for kind, text in CppTokenizer(body).tokenize():
+            if kind == 'access':
+                current_access = sys.intern(text)
                 continue
             
-            # Skip empty lines, preprocessor, comments
-            if not line or line.startswith('#') or line.startswith('//') or line.startswith('/*'):
-                i += 1
-                continue
-            
-            # Skip lines that are clearly not declarations
-            if line.startswith('return ') or line.startswith('if ') or line.startswith('for '):
-                i += 1
+            # Skip statements that are clearly not declarations
+            if text.startswith('return ') or text.startswith('if ') or text.startswith('for '):
                 continue
             
             # Try to parse as a method first (has parentheses)
-            method = self._try_parse_method(line, current_access)
-            if method:
-                cpp_class.methods.append(method)
-                i += 1
-                continue
+            if kind == 'method':
+                # Constructors and destructors, e.g. `explicit Name(...)`, are
+                # neither methods to bind nor fields
+                head = text[:text.index('(')].split()
+                if head and head[-1].lstrip('~') == cpp_class.name:
+                    continue
+                method = self._try_parse_method(text, current_access)
+                if method:
+                    cpp_class.methods.append(method)
+                    continue
             
             # Try to parse as a field
-            field = self._try_parse_field(line, current_access)
+            field = self._try_parse_field(text, current_access)
             if field:
                 cpp_class.fields.append(field)
-            
-            i += 1
-    
-    def _remove_inline_bodies(self, body: str) -> str:
-        """Remove inline method/function bodies to simplify parsing"""
-        result = []
-        i = 0
-        
-        while i < len(body):
-            char = body[i]
-            
-            if char == '{':
-                # Look back to determine if this is a method body or field initializer
-                lookback = ''.join(result[-100:]).rstrip()  # Look at what we've collected
-                
-                # It's a method body if preceded by ) or ) const/override/final
-                is_method_body = bool(re.search(r'\)\s*(const\s*)?(override\s*)?(final\s*)?$', lookback))
-                
-                if is_method_body:
-                    # Skip the entire method body
-                    depth = 1
-                    i += 1
-                    while i < len(body) and depth > 0:
-                        if body[i] == '{':
-                            depth += 1
-                        elif body[i] == '}':
-                            depth -= 1
-                        i += 1
-                    # Add a semicolon to mark the end of the method declaration
-                    result.append(';')
-                    continue
-                else:
-                    # It's likely a field initializer like `int x{0};` - keep it
-                    result.append(char)
-            else:
-                result.append(char)
-            
-            i += 1
-        
-        return ''.join(result)
     
     def _try_parse_field(self, line: str, access: str) -> Optional[CppField]:
         """Try to parse a line as a field declaration"""
         
-        # Remove trailing semicolon and comments
-        line = re.sub(r'//.*$', '', line).strip()
+        # Remove trailing semicolon
+        line = line.strip()
         if not line.endswith(';'):
             return None
         line = line[:-1].strip()
@@ -321,23 +657,21 @@ class CppParser:
         # Skip if it looks like a method (has parentheses not in template)
         # But allow things like std::function<...>
         paren_count = line.count('(') - line.count(')')
-        if '(' in line and paren_count == 0 and not re.search(r'std::\w+<', line):
+        if '(' in line and paren_count == 0 and not _RE_STDFUNC.search(line):
             return None
         
         # Skip using, typedef, friend, and other non-field declarations
-        skip_prefixes = ('using ', 'typedef ', 'friend ', 'return ', 'if ', 'for ', 'while ', 'switch ')
-        if any(line.startswith(p) for p in skip_prefixes):
+        if _RE_SKIP_PREFIX.match(line):
             return None
         
         # Skip if the line is just a keyword
-        keywords = {'const', 'static', 'virtual', 'inline', 'explicit', 'override', 'final', 
-                   'public', 'private', 'protected', 'mutable', 'volatile', 'extern'}
-        if line.strip() in keywords:
+        if line.strip() in _KEYWORDS:
             return None
         
-        # Parse field
-        is_static = 'static ' in line
-        is_const = 'const ' in line or ' const ' in line
+        # Parse field - a single scan picks up all modifier keywords
+        modifiers = _RE_MODIFIERS.findall(line)
+        is_static = 'static' in modifiers
+        is_const = 'const' in modifiers
         
         # Remove static/const for easier parsing
         clean_line = line.replace('static ', '').replace('const ', '').strip()
@@ -373,27 +707,29 @@ class CppParser:
         is_reference = '&' in parts[-1] and '&&' not in parts[-1]
         
         # Validate name is a valid identifier
-        if not re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', name):
+        if not _is_identifier(name):
             return None
         
         # Skip if name is a reserved keyword
-        if name in keywords:
+        if name in _KEYWORDS:
             return None
         
         # The type is everything except the last part
-        cpp_type = ' '.join(parts[:-1])
+        # Type names repeat heavily across a codebase, so share one string each
+        cpp_type = sys.intern(' '.join(parts[:-1]))
         
         # Skip if type is empty or just keywords
-        if not cpp_type or cpp_type in keywords:
+        if not cpp_type or cpp_type in _KEYWORDS:
             return None
         
         # Check for shared_ptr, unique_ptr, vector, etc.
         is_shared_ptr = 'shared_ptr' in cpp_type
         inner_type = None
         
-        template_match = re.search(r'<(.+)>', cpp_type)
-        if template_match:
-            inner_type = template_match.group(1).strip()
+        template_start = cpp_type.find('<')
+        template_end = cpp_type.rfind('>')
+        if template_start != -1 and template_end > template_start + 1:
+            inner_type = cpp_type[template_start+1:template_end].strip()
         
         return CppField(
             name=name,
@@ -415,32 +751,34 @@ class CppParser:
         if '(' not in line:
             return None
         
+        # Member templates and friends can't be bound as plain member pointers
+        if _RE_SKIP_PREFIX.match(line):
+            return None
+        
         # Skip if it's just a field with std::function or similar
         if line.strip().endswith(';') and '(' in line:
             # Check if the parens are inside a template
             before_paren = line[:line.index('(')]
-            if '<' in before_paren and '>' in before_paren:
+            if before_paren.count('<') > before_paren.count('>'):
                 # Likely a field like std::function<void()> name;
                 return None
         
         # Pattern for method: [keywords] return_type name(params) [const] [override] [= ...] ;
         # or inline definition with { }
         
-        is_virtual = 'virtual ' in line
-        is_static = 'static ' in line
-        is_inline = 'inline ' in line
+        modifiers = _RE_MODIFIERS.findall(line)
+        is_virtual = 'virtual' in modifiers
+        is_static = 'static' in modifiers
+        is_inline = 'inline' in modifiers
         is_const = ') const' in line or ')const' in line
-        is_override = 'override' in line
+        is_override = 'override' in modifiers
         
         # Clean up keywords
         clean = line
-        for kw in ['virtual ', 'static ', 'inline ', 'override', 'final']:
+        for kw in ['virtual ', 'static ', 'inline ', 'explicit ', 'constexpr ', 'override', 'final']:
             clean = clean.replace(kw, '')
         clean = clean.strip()
         
-        # Remove const after )
-        clean = re.sub(r'\)\s*const', ')', clean)
-        
         # Find the opening paren
         paren_pos = clean.find('(')
         if paren_pos == -1:
@@ -454,10 +792,10 @@ class CppParser:
             return None
         
         name = parts[-1].strip('*&')
-        return_type = ' '.join(parts[:-1]) if len(parts) > 1 else 'void'
+        return_type = sys.intern(' '.join(parts[:-1])) if len(parts) > 1 else 'void'
         
         # Validate name is a valid identifier (or destructor ~Name)
-        if not re.match(r'^~?[a-zA-Z_][a-zA-Z0-9_]*$', name):
+        if not _is_identifier(name[1:] if name.startswith('~') else name):
             return None
         
         # Skip constructors/destructors for now (or handle them)
@@ -486,47 +824,36 @@ class CppParser:
     
     def _find_matching_paren(self, s: str, start: int) -> int:
         """Find matching closing parenthesis"""
-        depth = 0
-        for i in range(start, len(s)):
-            if s[i] == '(':
-                depth += 1
-            elif s[i] == ')':
-                depth -= 1
-                if depth == 0:
-                    return i
-        return -1
+        return _find_closing(s, start, '(', ')')
     
     def _parse_params(self, params_str: str) -> list:
-        """Parse parameter string into list of (type, name, default) tuples"""
+        """Parse parameter string into a list of CppParam"""
         if not params_str.strip():
             return []
         
         params = []
-        # Split by comma, but be careful of templates
-        current = ""
+        # Split by comma, but be careful of templates; only the split
+        # points are tracked and each parameter is sliced out in one go
+        start = 0
         depth = 0
         
-        for char in params_str + ',':
+        for i, char in enumerate(params_str + ','):
             if char in '<([':
                 depth += 1
-                current += char
             elif char in '>)]':
                 depth -= 1
-                current += char
             elif char == ',' and depth == 0:
-                param = current.strip()
+                param = params_str[start:i].strip()
                 if param:
                     parsed = self._parse_single_param(param)
                     if parsed:
                         params.append(parsed)
-                current = ""
-            else:
-                current += char
+                start = i + 1
         
         return params
     
-    def _parse_single_param(self, param: str) -> Optional[tuple]:
-        """Parse a single parameter into (type, name, default)"""
+    def _parse_single_param(self, param: str) -> Optional[CppParam]:
+        """Parse a single parameter into a CppParam"""
         default = None
         if '=' in param:
             param, default = param.split('=', 1)
@@ -538,58 +865,39 @@ class CppParser:
             return None
         
         name = parts[-1].strip('*&') if len(parts) > 1 else ""
-        ptype = ' '.join(parts[:-1]) if len(parts) > 1 else parts[0]
+        ptype = sys.intern(' '.join(parts[:-1]) if len(parts) > 1 else parts[0])
         
-        return (ptype, name, default)
+        return CppParam(ptype, name, default)
     
     def find_enum(self, name: str, namespace: str = "") -> Optional[CppEnum]:
         """Find an enum definition by name"""
-        for file_path, content in self.files_content.items():
-            result = self._parse_enum_in_content(content, name, namespace)
-            if result:
-                return result
-        return None
+        key = (name, namespace)
+        if key not in self._enum_cache:
+            decl = self._find_declaration(name, namespace, ('enum',))
+            self._enum_cache[key] = self._parse_enum_at(decl) if decl else None
+        return self._enum_cache[key]
     
-    def _parse_enum_in_content(self, content: str, name: str, namespace: str) -> Optional[CppEnum]:
-        """Parse enum from file content"""
-        
-        if namespace:
-            ns_pattern = rf'namespace\s+{re.escape(namespace)}\s*\{{'
-            ns_match = re.search(ns_pattern, content)
-            if not ns_match:
-                return None
-            search_content = content[ns_match.end():]
-        else:
-            search_content = content
-        
-        # Pattern for enum
-        pattern = rf'enum\s+(class\s+)?{re.escape(name)}\s*(?::\s*(\w+))?\s*\{{'
-        
-        match = re.search(pattern, search_content)
-        if not match:
+    def _parse_enum_at(self, decl: tuple) -> Optional[CppEnum]:
+        """Parse the enum whose definition was indexed at decl"""
+        file_path, start, end, _, namespace = decl
+        content = self._file_text(file_path)
+        
+        body = self._extract_braced_content(content, end - 1)
+        match = _RE_DECL.match(content, start)
+        if not body or not match:
             return None
         
-        is_class = match.group(1) is not None
-        underlying = match.group(2)
-        
-        brace_start = match.end() - 1
-        body = self._extract_braced_content(search_content, brace_start)
-        
-        if not body:
-            return None
+        name = sys.intern(match.group('name'))
+        is_class = match.group('scoped') is not None
+        underlying = match.group('base')
         
         # Parse enum values
-        values = []
+        values: list = []
         for line in body.split(','):
             line = line.strip()
             if not line:
                 continue
             
-            # Remove comments
-            line = re.sub(r'//.*$', '', line).strip()
-            if not line:
-                continue
-            
             if '=' in line:
                 vname, vval = line.split('=', 1)
                 values.append((vname.strip(), vval.strip()))
@@ -609,6 +917,69 @@ class CppParser:
 # Binding Generator
 # ============================================================================
 
+_PY_RESERVED_NAMES = frozenset({'None', 'True', 'False', 'and', 'or', 'not', 'in', 'is'})
+
+# Field and method bindings are cached without the class name, which is
+# substituted for this placeholder, so members that look the same across
+# classes (e.g. `std::string name`) are only formatted once
+_CLASS_PLACEHOLDER = '{cls}'
+
+
+@functools.lru_cache(maxsize=4096)
+def _field_binding(name: str, cpp_type: str, is_static: bool) -> str:
+    """Generate binding for a single field, with a class name placeholder"""
+    class_name = _CLASS_PLACEHOLDER
+    
+    # Skip complex fields that need special handling
+    if is_static:
+        return f'.def_readonly_static("{name}", &{class_name}::{name})'
+    
+    # string_view needs a lambda to convert to string
+    if 'string_view' in cpp_type:
+        return (f'.def_property_readonly("{name}", []({class_name} const& self) {{ '
+               f'return std::string(self.{name}); }})')
+    
+    # Use def_readonly for most fields (read-only from Python)
+    return f'.def_readonly("{name}", &{class_name}::{name})'
+
+
+@functools.lru_cache(maxsize=4096)
+def _method_binding(name: str, return_type: str, params: tuple, is_const: bool,
+                    is_static: bool = False, overloaded: bool = False) -> str:
+    """Generate binding for a single method, with a class name placeholder"""
+    class_name = _CLASS_PLACEHOLDER
+    
+    # Skip certain methods
+    if name in ('operator=', 'operator==', 'operator!=', 'operator<'):
+        return ""
+    
+    # Build parameter string with defaults
+    params_with_defaults = []
+    for ptype, pname, default in params:
+        if default:
+            params_with_defaults.append(f'py::arg("{pname}") = {default}')
+        elif pname:
+            params_with_defaults.append(f'py::arg("{pname}")')
+    
+    params_str = ', '.join(params_with_defaults)
+    
+    # Const and overloaded methods need the exact pointer type
+    param_types = ', '.join(p.cpp_type for p in params)
+    if is_const:
+        method_ptr = f'static_cast<{return_type} ({class_name}::*)({param_types}) const>(&{class_name}::{name})'
+    elif overloaded and is_static:
+        method_ptr = f'static_cast<{return_type} (*)({param_types})>(&{class_name}::{name})'
+    elif overloaded:
+        method_ptr = f'static_cast<{return_type} ({class_name}::*)({param_types})>(&{class_name}::{name})'
+    else:
+        method_ptr = f'&{class_name}::{name}'
+    
+    if params_str:
+        return f'.def("{name}", {method_ptr}, {params_str})'
+    else:
+        return f'.def("{name}", {method_ptr})'
+
+
 class BindingGenerator:
     """Generates pybind11 binding code from parsed C++ types"""
     
@@ -618,105 +989,63 @@ class BindingGenerator:
     def generate_class_binding(self, cpp_class: CppClass) -> str:
         """Generate pybind11 binding for a class/struct"""
         
-        lines = []
         full_name = f"{cpp_class.namespace}::{cpp_class.name}" if cpp_class.namespace else cpp_class.name
         
-        # Header comment
-        lines.append(f"// ============================================================================")
-        lines.append(f"// Binding for {full_name}")
-        lines.append(f"// Source: {cpp_class.source_file}")
-        lines.append(f"// ============================================================================")
-        lines.append("")
-        
         # Check if it uses shared_ptr
         uses_shared_ptr = any(
             f.is_shared_ptr or 'shared_ptr' in f.cpp_type 
             for f in cpp_class.fields
         )
         
-        # Class definition
+        # Class definition holder type
         if uses_shared_ptr or any('shared_ptr' in str(m.return_type) for m in cpp_class.methods):
-            lines.append(f'py::class_<{full_name}, std::shared_ptr<{full_name}>>(m, "{cpp_class.name}")')
+            holder = f', std::shared_ptr<{full_name}>'
         else:
-            lines.append(f'py::class_<{full_name}>(m, "{cpp_class.name}")')
-        
-        # Default constructor
-        lines.append(f'    .def(py::init<>())')
+            holder = ''
         
         # Public fields
         public_fields = [f for f in cpp_class.fields if f.access == 'public' and not f.is_static]
-        for fld in public_fields:
-            binding = self._generate_field_binding(fld, full_name)
-            if binding:
-                lines.append(f'    {binding}')
+        field_bindings = [self._generate_field_binding(fld, full_name) for fld in public_fields]
         
         # Public methods (non-virtual, non-override for simplicity)
         public_methods = [
             m for m in cpp_class.methods 
             if m.access == 'public' and not m.name.startswith('operator')
         ]
+        # Overloads are counted across all access levels, any of them makes
+        # a plain &Class::name ambiguous
+        name_counts = Counter(m.name for m in cpp_class.methods)
+        method_bindings = [
+            self._generate_method_binding(method, full_name, name_counts[method.name] > 1)
+            for method in public_methods
+        ]
         
-        for method in public_methods:
-            binding = self._generate_method_binding(method, full_name)
-            if binding:
-                lines.append(f'    {binding}')
-        
-        # Add __repr__ method
-        lines.append(self._generate_repr(cpp_class, full_name))
-        
-        # Close with semicolon
-        lines[-1] = lines[-1].rstrip().rstrip(';') + ';'
-        
-        lines.append("")
-        return '\n'.join(lines)
+        members_block = ''.join(f'    {binding}\n' for binding in field_bindings + method_bindings if binding)
+        
+        # Header comment, class definition with default constructor, members,
+        # and __repr__ closing the chain with a semicolon
+        return (
+            f"// ============================================================================\n"
+            f"// Binding for {full_name}\n"
+            f"// Source: {cpp_class.source_file}\n"
+            f"// ============================================================================\n"
+            f"\n"
+            f'py::class_<{full_name}{holder}>(m, "{cpp_class.name}")\n'
+            f"    .def(py::init<>())\n"
+            f"{members_block}"
+            f"{self._generate_repr(cpp_class, full_name)};\n"
+        )
     
     def _generate_field_binding(self, fld: CppField, class_name: str) -> str:
         """Generate binding for a single field"""
-        
-        # Skip complex fields that need special handling
-        if fld.is_static:
-            return f'.def_readonly_static("{fld.name}", &{class_name}::{fld.name})'
-        
-        # string_view needs a lambda to convert to string
-        if 'string_view' in fld.cpp_type:
-            return (f'.def_property_readonly("{fld.name}", []({class_name} const& self) {{ '
-                   f'return std::string(self.{fld.name}); }})')
-        
-        # Use def_readonly for most fields (read-only from Python)
-        return f'.def_readonly("{fld.name}", &{class_name}::{fld.name})'
+        return _field_binding(fld.name, fld.cpp_type, fld.is_static).replace(_CLASS_PLACEHOLDER, class_name)
     
-    def _generate_method_binding(self, method: CppMethod, class_name: str) -> str:
+    def _generate_method_binding(self, method: CppMethod, class_name: str, overloaded: bool = False) -> str:
         """Generate binding for a single method"""
-        
-        # Skip certain methods
-        if method.name in ('operator=', 'operator==', 'operator!=', 'operator<'):
-            return ""
-        
-        # Build parameter string with defaults
-        params_with_defaults = []
-        for ptype, pname, default in method.params:
-            if default:
-                params_with_defaults.append(f'py::arg("{pname}") = {default}')
-            elif pname:
-                params_with_defaults.append(f'py::arg("{pname}")')
-        
-        params_str = ', '.join(params_with_defaults)
-        
-        # Handle const methods
-        if method.is_const:
-            method_ptr = f'static_cast<{method.return_type} ({class_name}::*)({self._params_to_types(method.params)}) const>(&{class_name}::{method.name})'
-        else:
-            method_ptr = f'&{class_name}::{method.name}'
-        
-        if params_str:
-            return f'.def("{method.name}", {method_ptr}, {params_str})'
-        else:
-            return f'.def("{method.name}", {method_ptr})'
-    
-    def _params_to_types(self, params: list) -> str:
-        """Convert params list to just types for function pointer cast"""
-        types = [ptype for ptype, _, _ in params]
-        return ', '.join(types)
+        return _method_binding(
+            method.name, method.return_type, tuple(method.params), method.is_const,
+            method.is_static, overloaded
+        ).replace(_CLASS_PLACEHOLDER, class_name)
     
     def _generate_repr(self, cpp_class: CppClass, full_name: str) -> str:
         """Generate __repr__ method"""
@@ -745,109 +1074,189 @@ class BindingGenerator:
     def generate_enum_binding(self, cpp_enum: CppEnum) -> str:
         """Generate pybind11 binding for an enum"""
         
-        lines = []
         full_name = f"{cpp_enum.namespace}::{cpp_enum.name}" if cpp_enum.namespace else cpp_enum.name
         
-        lines.append(f'// Enum: {full_name}')
-        lines.append(f'py::enum_<{full_name}>(m, "{cpp_enum.name}")')
-        
-        for vname, vval in cpp_enum.values:
-            # Handle Python reserved words
-            py_name = vname
-            if vname in ('None', 'True', 'False', 'and', 'or', 'not', 'in', 'is'):
-                py_name = vname + '_'
-            
-            lines.append(f'    .value("{py_name}", {full_name}::{vname})')
-        
-        lines.append('    .export_values();')
-        lines.append('')
+        # Handle Python reserved words
+        values_block = ''.join(
+            f'    .value("{vname + "_" if vname in _PY_RESERVED_NAMES else vname}", {full_name}::{vname})\n'
+            for vname, _ in cpp_enum.values
+        )
         
-        return '\n'.join(lines)
+        return (
+            f'// Enum: {full_name}\n'
+            f'py::enum_<{full_name}>(m, "{cpp_enum.name}")\n'
+            f'{values_block}'
+            f'    .export_values();\n'
+        )
     
     def generate_header_file(self, cpp_class: CppClass, binding_code: str) -> str:
         """Generate complete header file with binding"""
+        return ''.join(self.iter_header_file(cpp_class, binding_code))
+    
+    def iter_header_file(self, cpp_class: CppClass, binding_code: str) -> Iterator[str]:
+        """Yield the complete header file with binding piece by piece"""
         
-        lines = []
-        
-        # Header guard
-        guard_name = f"PY_BINDING_{cpp_class.name.upper()}_H"
-        lines.append(f"#pragma once")
-        lines.append(f"// Auto-generated pybind11 bindings for {cpp_class.name}")
-        lines.append(f"// Generated by generate_bindings.py")
-        lines.append("")
-        lines.append("#include <pybind11/pybind11.h>")
-        lines.append("#include <pybind11/stl.h>")
-        lines.append("")
-        
-        # Include source header
+        # Include source header, made relative
+        source_include = ''
         if cpp_class.source_file:
-            # Make it a relative include
-            source_name = os.path.basename(cpp_class.source_file)
-            lines.append(f'#include "{source_name}"')
-        lines.append("")
-        
-        lines.append("namespace py = pybind11;")
-        lines.append("")
-        
-        # Binding function
-        func_name = f"bind_{cpp_class.name}"
-        lines.append(f"inline void {func_name}(py::module_& m) {{")
-        lines.append("")
+            source_include = f'#include "{os.path.basename(cpp_class.source_file)}"\n'
+        
+        yield (
+            f"#pragma once\n"
+            f"// Auto-generated pybind11 bindings for {cpp_class.name}\n"
+            f"// Generated by generate_bindings.py\n"
+            f"\n"
+            f"#include <pybind11/pybind11.h>\n"
+            f"#include <pybind11/stl.h>\n"
+            f"\n"
+            f"{source_include}"
+            f"\n"
+            f"namespace py = pybind11;\n"
+            f"\n"
+            f"inline void bind_{cpp_class.name}(py::module_& m) {{\n"
+            f"\n"
+        )
         
         # Indent the binding code
         for line in binding_code.split('\n'):
-            if line.strip():
-                lines.append("    " + line)
-            else:
-                lines.append("")
-        
-        lines.append("}")
-        lines.append("")
+            yield f'    {line}\n' if line.strip() else '\n'
         
-        return '\n'.join(lines)
-
+        yield "}\n"
+    
+    def generate_enum_header_file(self, cpp_enum: CppEnum, binding_code: str) -> str:
+        """Wrap an enum binding in a simple header"""
+        return (
+            f"#pragma once\n"
+            f"// Auto-generated pybind11 bindings for enum {cpp_enum.name}\n"
+            f"\n"
+            f"#include <pybind11/pybind11.h>\n"
+            f"\n"
+            f"namespace py = pybind11;\n"
+            f"\n"
+            f"inline void bind_{cpp_enum.name}(py::module_& m) {{\n"
+            f"\n"
+            f"{binding_code}\n"
+            f"}}\n"
+        )
 
 # ============================================================================
 # Dependency Analyzer
 # ============================================================================
 
+# Known types that don't need custom bindings
+_BUILTIN_TYPES = frozenset({
+    'int', 'int8_t', 'int16_t', 'int32_t', 'int64_t',
+    'uint8_t', 'uint16_t', 'uint32_t', 'uint64_t',
+    'float', 'double', 'bool', 'char', 'void',
+    'size_t', 'ssize_t',
+    'std::string', 'string',
+    'std::string_view', 'string_view',
+})
+
+# STL containers to ignore (but extract their inner types)
+_STL_CONTAINERS = frozenset({
+    'std::vector', 'vector',
+    'std::list', 'list',
+    'std::map', 'map',
+    'std::unordered_map', 'unordered_map',
+    'std::set', 'set',
+    'std::unordered_set', 'unordered_set',
+    'std::shared_ptr', 'shared_ptr',
+    'std::unique_ptr', 'unique_ptr',
+    'std::weak_ptr', 'weak_ptr',
+    'std::optional', 'optional',
+    'std::pair', 'pair',
+    'std::tuple', 'tuple',
+    'std::function', 'function',
+    'std::array', 'array',
+    'std::mutex', 'mutex',
+    'std::atomic', 'atomic',
+    'std::thread', 'thread',
+    'std::condition_variable', 'condition_variable',
+    'std::lock_guard', 'lock_guard',
+    'std::unique_lock', 'unique_lock',
+    'std::chrono', 'chrono',
+})
+
+
+# Words that can appear in a type string but never name a type of their own
+_TYPE_KEYWORDS = frozenset({
+    'const', 'volatile', 'mutable', 'static', 'constexpr', 'inline',
+    'signed', 'unsigned', 'short', 'long',
+    'struct', 'class', 'enum', 'union', 'typename', 'auto',
+    'explicit', 'virtual', 'template', 'decltype', 'sizeof', 'noexcept', 'operator',
+})
+
+# Every name that is skipped once any namespace prefix is removed; the
+# qualified std:: spellings of the sets above are caught by their prefix
+_IGNORED = _BUILTIN_TYPES | _STL_CONTAINERS | _TYPE_KEYWORDS
+
+# Pointer and reference markers, removed in one pass with str.translate
+_STRIP_QUALIFIERS = str.maketrans('', '', '&*')
+
+
+def _check_and_add_type(type_name: str, deps: set):
+    """Check if a type name is a custom type and add it to deps"""
+    
+    # std:: types, listed or not, are never custom
+    if not type_name or type_name.startswith('std::'):
+        return
+    
+    # Remove namespace prefix for checking
+    simple_name = type_name.rpartition('::')[2]
+    
+    # Skip builtin types, STL containers and keywords
+    if simple_name in _IGNORED:
+        return
+    
+    # Skip if not a valid identifier
+    if not _RE_IDENT.match(simple_name):
+        return
+    
+    # Likely a custom type - add it, interned so every set holding it shares one copy
+    deps.add(sys.intern(simple_name))
+
+
+def _is_plain_type(type_str: str) -> bool:
+    """Check that no '=' or '(' appears outside template brackets
+    
+    Those only show up in misparsed declarations like `int x = sizeof(int)`
+    or in decltype(...), whose words are not type names.
+    """
+    depth = 0
+    for char in type_str:
+        if char == '<':
+            depth += 1
+        elif char == '>':
+            depth -= 1
+        elif (char == '=' or char == '(') and depth <= 0:
+            return False
+    return True
+
+
+@functools.lru_cache(maxsize=None)
+def _type_deps(type_str: str) -> frozenset:
+    """Custom type names referenced by a normalized type string"""
+    deps: set = set()
+    if type_str.isidentifier():
+        # A plain name, nothing to scan
+        _check_and_add_type(type_str, deps)
+        return frozenset(deps)
+    if ('=' in type_str or '(' in type_str) and not _is_plain_type(type_str):
+        return frozenset(deps)
+    # Every (possibly qualified) name in the string, outer and nested, is a
+    # candidate, so "std::vector<std::shared_ptr<stat_value>>" finds
+    # "stat_value" without walking the template brackets
+    for token in _RE_TYPE_NAME.findall(type_str):
+        _check_and_add_type(token, deps)
+    return frozenset(deps)
+
+
 class DependencyAnalyzer:
     """Analyzes dependencies between C++ types"""
     
-    # Known types that don't need custom bindings
-    BUILTIN_TYPES = {
-        'int', 'int8_t', 'int16_t', 'int32_t', 'int64_t',
-        'uint8_t', 'uint16_t', 'uint32_t', 'uint64_t',
-        'float', 'double', 'bool', 'char', 'void',
-        'size_t', 'ssize_t',
-        'std::string', 'string',
-        'std::string_view', 'string_view',
-    }
-    
-    # STL containers to ignore (but extract their inner types)
-    STL_CONTAINERS = {
-        'std::vector', 'vector',
-        'std::list', 'list',
-        'std::map', 'map',
-        'std::unordered_map', 'unordered_map',
-        'std::set', 'set',
-        'std::unordered_set', 'unordered_set',
-        'std::shared_ptr', 'shared_ptr',
-        'std::unique_ptr', 'unique_ptr',
-        'std::weak_ptr', 'weak_ptr',
-        'std::optional', 'optional',
-        'std::pair', 'pair',
-        'std::tuple', 'tuple',
-        'std::function', 'function',
-        'std::array', 'array',
-        'std::mutex', 'mutex',
-        'std::atomic', 'atomic',
-        'std::thread', 'thread',
-        'std::condition_variable', 'condition_variable',
-        'std::lock_guard', 'lock_guard',
-        'std::unique_lock', 'unique_lock',
-        'std::chrono', 'chrono',
-    }
+    BUILTIN_TYPES = _BUILTIN_TYPES
+    STL_CONTAINERS = _STL_CONTAINERS
     
     def __init__(self, parser: CppParser):
         self.parser = parser
@@ -855,145 +1264,53 @@ class DependencyAnalyzer:
     def find_dependencies(self, cpp_class: CppClass) -> list:
         """Find all custom types this class depends on"""
         
-        deps = set()
+        # Field types, method return types and parameters
+        type_strs = [f.cpp_type for f in cpp_class.fields]
+        type_strs += [f.inner_type for f in cpp_class.fields if f.inner_type]
+        type_strs += [m.return_type for m in cpp_class.methods]
+        type_strs += [p.cpp_type for m in cpp_class.methods for p in m.params]
         
-        # Check field types
-        for field in cpp_class.fields:
-            self._extract_type_deps(field.cpp_type, deps)
-            if field.inner_type:
-                self._extract_type_deps(field.inner_type, deps)
-        
-        # Check method return types and parameters
-        for method in cpp_class.methods:
-            self._extract_type_deps(method.return_type, deps)
-            for ptype, _, _ in method.params:
-                self._extract_type_deps(ptype, deps)
+        # Each lookup is a cached frozenset, merged in a single union
+        deps: set = set().union(*map(self._type_deps_of, type_strs))
         
         # Check base classes
-        for base in cpp_class.base_classes:
-            if base and base not in self.BUILTIN_TYPES:
-                deps.add(base)
+        deps.update(base for base in cpp_class.base_classes if base and base not in _IGNORED)
         
         # Remove the class itself
         deps.discard(cpp_class.name)
         
         return sorted(deps)
     
-    def _extract_type_deps(self, type_str: str, deps: set):
+    def _type_deps_of(self, type_str: str) -> frozenset:
         """Extract dependent type names from a type string"""
         
         if not type_str:
-            return
-        
-        # Remove const, &, *, etc.
-        type_str = type_str.replace('const ', '').replace('&', '').replace('*', '').strip()
-        
-        # Extract all types from nested templates
-        # e.g., "std::vector<std::shared_ptr<stat_value>>" should find "stat_value"
-        self._extract_all_types(type_str, deps)
-    
-    def _extract_all_types(self, type_str: str, deps: set):
-        """Recursively extract all type names from a possibly nested template type"""
-        
-        if not type_str:
-            return
+            return frozenset()
         
+        # Remove const, &, *, etc. - plain names like "int" or "Entity" skip this
+        if 'const ' in type_str or '&' in type_str or '*' in type_str:
+            type_str = type_str.replace('const ', '').translate(_STRIP_QUALIFIERS)
         type_str = type_str.strip()
         
-        # Check if this is a template type
-        template_start = type_str.find('<')
-        if template_start != -1:
-            # Get the outer type name
-            outer_type = type_str[:template_start].strip()
-            
-            # Find matching >
-            template_end = self._find_matching_bracket(type_str, template_start)
-            if template_end != -1:
-                # Extract inner types
-                inner = type_str[template_start + 1:template_end]
-                
-                # Split by comma (careful with nested templates)
-                inner_types = self._split_template_args(inner)
-                
-                for inner_type in inner_types:
-                    self._extract_all_types(inner_type.strip(), deps)
-            
-            # Check if outer type is a custom type (not STL)
-            self._check_and_add_type(outer_type, deps)
-        else:
-            # No template, just a simple type
-            self._check_and_add_type(type_str, deps)
-    
-    def _check_and_add_type(self, type_name: str, deps: set):
-        """Check if a type name is a custom type and add it to deps"""
-        
-        if not type_name:
-            return
-        
-        # Remove namespace prefix for checking
-        simple_name = type_name.split('::')[-1]
-        
-        # Skip builtin types
-        if type_name in self.BUILTIN_TYPES or simple_name in self.BUILTIN_TYPES:
-            return
-        
-        # Skip STL containers
-        if type_name in self.STL_CONTAINERS or simple_name in self.STL_CONTAINERS:
-            return
-        
-        # Skip std:: types we haven't explicitly listed
-        if type_name.startswith('std::'):
-            return
-        
-        # Skip if not a valid identifier
-        if not re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', simple_name):
-            return
-        
-        # Likely a custom type - add it
-        deps.add(simple_name)
-    
-    def _find_matching_bracket(self, s: str, start: int) -> int:
-        """Find the matching > for a < at position start"""
-        depth = 0
-        for i in range(start, len(s)):
-            if s[i] == '<':
-                depth += 1
-            elif s[i] == '>':
-                depth -= 1
-                if depth == 0:
-                    return i
-        return -1
-    
-    def _split_template_args(self, args: str) -> list:
-        """Split template arguments by comma, respecting nested templates"""
-        result = []
-        current = ""
-        depth = 0
-        
-        for char in args:
-            if char == '<':
-                depth += 1
-                current += char
-            elif char == '>':
-                depth -= 1
-                current += char
-            elif char == ',' and depth == 0:
-                if current.strip():
-                    result.append(current.strip())
-                current = ""
-            else:
-                current += char
-        
-        if current.strip():
-            result.append(current.strip())
-        
-        return result
+        # The same type strings recur across classes, so each is walked once
+        return _type_deps(type_str)
 
 
 # ============================================================================
 # Main
 # ============================================================================
 
+def _positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a whole number of at least 1, got '{value}'")
+    return number
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Generate pybind11 bindings from C++ struct/class definitions',
@@ -1005,6 +1322,7 @@ Examples:
     python generate_bindings.py ../src EventType --namespace swtor --enum
     python generate_bindings.py ../src CombatLine --namespace swtor --recursive
     python generate_bindings.py ../src CombatLine --namespace swtor --recursive --force
+    python generate_bindings.py ../src CombatLine --namespace swtor --recursive --incremental --jobs 4
         """
     )
     
@@ -1017,13 +1335,21 @@ Examples:
     parser.add_argument('--stdout', '-s', action='store_true', help='Print to stdout instead of file')
     parser.add_argument('--recursive', '-r', action='store_true', help='Recursively generate bindings for all dependencies')
     parser.add_argument('--force', '-f', action='store_true', help='Overwrite existing binding files (default: preserve existing)')
+    parser.add_argument('--jobs', '-j', type=_positive_int, default=None, help='Number of parallel workers; more than 1 also renders --recursive bindings in worker processes (default: one reader thread per CPU)')
+    parser.add_argument('--incremental', '-i', action='store_true', help='Cache the declaration index in <output>/.bindings_cache and skip unchanged files')
     
     args = parser.parse_args()
     
+    # Fail before scanning anything
+    if not os.path.isdir(args.folder):
+        print(f"Error: Folder '{args.folder}' does not exist")
+        return 1
+    
     # Parse C++ files
     print(f"Scanning C++ files in: {args.folder}")
-    cpp_parser = CppParser(args.folder)
-    print(f"Found {len(cpp_parser.files_content)} files")
+    cache_dir = os.path.join(args.output, '.bindings_cache') if args.incremental else None
+    cpp_parser = CppParser(args.folder, cache_dir, args.jobs)
+    print(f"Found {len(cpp_parser.file_paths)} files")
     
     generator = BindingGenerator()
     
@@ -1046,26 +1372,14 @@ Examples:
             if os.path.exists(output_file) and not args.force:
                 print(f"Preserved (exists): {output_file}")
             else:
-                # For enums, wrap in a simple header
-                full_code = f"""#pragma once
-// Auto-generated pybind11 bindings for enum {args.name}
-
-#include <pybind11/pybind11.h>
-
-namespace py = pybind11;
-
-inline void bind_{args.name}(py::module_& m) {{
-
-{binding_code}
-}}
-"""
+                full_code = generator.generate_enum_header_file(cpp_enum, binding_code)
                 with open(output_file, 'w') as f:
                     f.write(full_code)
                 print(f"Generated: {output_file}")
     
     elif args.recursive:
         # Recursive generation of all dependencies
-        generate_recursive(cpp_parser, generator, args.name, args.namespace, args.output, args.force)
+        generate_recursive(cpp_parser, generator, args.name, args.namespace, args.output, args.force, args.jobs)
     
     else:
         # Generate class/struct binding
@@ -1104,25 +1418,61 @@ inline void bind_{args.name}(py::module_& m) {{
     return 0
 
 
+def _dependency_order(graph: dict) -> list:
+    """Order the names in {name: dependencies} so dependencies come first
+    
+    A cycle is broken by ignoring one of its edges; pybind11 only needs base
+    classes registered first, and those can never form a cycle.
+    """
+    import graphlib  # Only needed with --recursive
+    
+    graph = {name: list(deps) for name, deps in graph.items()}
+    while True:
+        try:
+            return list(graphlib.TopologicalSorter(graph).static_order())
+        except graphlib.CycleError as e:
+            # Each name in the cycle is a dependency of the one after it
+            cycle = e.args[1]
+            print(f"  Note: dependency cycle {' -> '.join(reversed(cycle))}, "
+                  f"ignoring {cycle[1]} -> {cycle[0]}")
+            graph[cycle[1]].remove(cycle[0])
+
+
+def _iter_binding(kind: str, obj, generator: BindingGenerator) -> Iterator[str]:
+    """Yield the complete header for a 'class' or 'enum'"""
+    if kind == 'enum':
+        yield generator.generate_enum_header_file(obj, generator.generate_enum_binding(obj))
+    else:
+        yield from generator.iter_header_file(obj, generator.generate_class_binding(obj))
+
+
+def _write_binding(job: tuple, generator: Optional[BindingGenerator] = None) -> str:
+    """Render one (kind, obj, output_file) job straight into its file"""
+    kind, obj, output_file = job
+    with open(output_file, 'w') as f:
+        f.writelines(_iter_binding(kind, obj, generator or BindingGenerator()))
+    return output_file
+
+
 def generate_recursive(cpp_parser: CppParser, generator: BindingGenerator, 
-                       root_name: str, namespace: str, output_dir: str, force: bool = False):
+                       root_name: str, namespace: str, output_dir: str, force: bool = False,
+                       jobs: Optional[int] = None):
     """Recursively generate bindings for a type and all its dependencies"""
     
     analyzer = DependencyAnalyzer(cpp_parser)
     
-    # Track what we've processed and what we need to process
-    processed = set()
-    to_process = [root_name]
-    generation_order = []  # Types in the order they should be bound
+    # Track what we need to process; a name enters seen when it is queued,
+    # so it is looked up at most once
+    to_process = deque([root_name])
+    seen = {root_name}
+    found: dict[str, tuple] = {}  # name -> (kind, parsed type)
+    graph: dict[str, list] = {}   # name -> names it depends on
     
     print(f"\n=== Analyzing dependencies for {root_name} ===")
     
     # Build the full dependency graph
     while to_process:
-        current = to_process.pop(0)
-        
-        if current in processed:
-            continue
+        current = to_process.popleft()
         
         # Try to find as class/struct first
         cpp_class = cpp_parser.find_class_or_struct(current, namespace)
@@ -1131,35 +1481,30 @@ def generate_recursive(cpp_parser: CppParser, generator: BindingGenerator,
             # Get dependencies
             deps = analyzer.find_dependencies(cpp_class)
             
-            # Add unprocessed dependencies to the front of the queue
+            # Add unseen dependencies to the front of the queue
             for dep in deps:
-                if dep not in processed and dep not in to_process:
-                    to_process.insert(0, dep)  # Process dependencies first
+                if dep not in seen:
+                    to_process.appendleft(dep)  # Process dependencies first
+                    seen.add(dep)
             
-            processed.add(current)
-            generation_order.append(('class', current, cpp_class))
+            found[current] = ('class', cpp_class)
+            graph[current] = deps
             print(f"  Found class/struct: {current} (depends on: {', '.join(deps) if deps else 'nothing'})")
         else:
             # Try as enum
             cpp_enum = cpp_parser.find_enum(current, namespace)
             if cpp_enum:
-                processed.add(current)
-                generation_order.append(('enum', current, cpp_enum))
+                found[current] = ('enum', cpp_enum)
+                graph[current] = []
                 print(f"  Found enum: {current}")
             else:
                 print(f"  Warning: Could not find '{current}' - may be a built-in type or external")
-                processed.add(current)  # Mark as processed so we don't keep trying
-    
-    # Reverse to get correct order (dependencies first)
-    generation_order.reverse()
     
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_order = []
-    for item in generation_order:
-        if item[1] not in seen:
-            seen.add(item[1])
-            unique_order.append(item)
+    # Dependencies first; names that were never found drop out here
+    unique_order = [
+        (found[name][0], name, found[name][1])
+        for name in _dependency_order(graph) if name in found
+    ]
     
     print(f"\n=== Generation order ({len(unique_order)} types) ===")
     for kind, name, _ in unique_order:
@@ -1168,6 +1513,8 @@ def generate_recursive(cpp_parser: CppParser, generator: BindingGenerator,
     # Generate all bindings
     print(f"\n=== Generating bindings ===")
     os.makedirs(output_dir, exist_ok=True)
+    # One directory listing instead of a stat per type
+    existing = set(os.listdir(output_dir)) if not force else set()
     
     generated_files = []
     bind_calls = []
@@ -1175,82 +1522,89 @@ def generate_recursive(cpp_parser: CppParser, generator: BindingGenerator,
     preserved_count = 0
     generated_count = 0
     
+    # Split off the types whose files are preserved, the rest get rendered
+    to_render: list[tuple[str, Optional[tuple]]] = []  # (filename, job or None)
     for kind, name, obj in unique_order:
-        output_file = os.path.join(output_dir, f"py_binding_{name.lower()}.h")
-        
-        # Check if file already exists
-        if os.path.exists(output_file) and not force:
-            print(f"  Preserved (exists): {output_file}")
-            preserved_count += 1
-            # Still add to the includes and bind calls
-            generated_files.append(f"py_binding_{name.lower()}.h")
-            bind_calls.append(f"bind_{name}(m);")
-            # Try to extract source file from existing binding
+        filename = f"py_binding_{name.lower()}.h"
+        if filename in existing:
+            to_render.append((filename, None))
+        else:
+            to_render.append((filename, (kind, obj, os.path.join(output_dir, filename))))
+    
+    pending = [job for _, job in to_render if job is not None]
+    executor = None
+    if jobs is not None and jobs > 1 and len(pending) > 1:
+        # Rendering a type takes well under a millisecond, so the pool only
+        # pays off for very large sets and is used only when asked for.
+        # Each file is rendered and written independently of the others, so
+        # the workers do both; only the master include needs all of them
+        from concurrent.futures import ProcessPoolExecutor
+        executor = ProcessPoolExecutor(max_workers=jobs)
+        written: Iterator = executor.map(_write_binding, pending, chunksize=8)
+    else:
+        written = (_write_binding(job, generator) for job in pending)
+    
+    try:
+        for (kind, name, obj), (filename, job) in zip(unique_order, to_render):
+            output_file = os.path.join(output_dir, filename)
+            
+            # Check if file already exists
+            if job is None:
+                print(f"  Preserved (exists): {output_file}")
+                preserved_count += 1
+                # Still add to the includes and bind calls
+                generated_files.append(filename)
+                bind_calls.append(f"bind_{name}(m);")
+                # Try to extract source file from existing binding
+                if kind == 'class' and obj.source_file:
+                    includes.add(os.path.basename(obj.source_file))
+                continue
+            
             if kind == 'class' and obj.source_file:
                 includes.add(os.path.basename(obj.source_file))
-            continue
-        
-        if kind == 'enum':
-            binding_code = generator.generate_enum_binding(obj)
-            full_code = f"""#pragma once
-// Auto-generated pybind11 bindings for enum {name}
-
-#include <pybind11/pybind11.h>
-
-namespace py = pybind11;
-
-inline void bind_{name}(py::module_& m) {{
-
-{binding_code}
-}}
-"""
-        else:  # class/struct
-            binding_code = generator.generate_class_binding(obj)
-            full_code = generator.generate_header_file(obj, binding_code)
-            if obj.source_file:
-                includes.add(os.path.basename(obj.source_file))
-        
-        with open(output_file, 'w') as f:
-            f.write(full_code)
-        
-        generated_files.append(f"py_binding_{name.lower()}.h")
-        bind_calls.append(f"bind_{name}(m);")
-        generated_count += 1
-        print(f"  Generated: {output_file}")
+            
+            next(written)  # Wait until this file is on disk
+            
+            generated_files.append(filename)
+            bind_calls.append(f"bind_{name}(m);")
+            generated_count += 1
+            print(f"  Generated: {output_file}")
+    finally:
+        if executor is not None:
+            executor.shutdown()
     
     # Generate a master include file (always regenerate this one)
     master_file = os.path.join(output_dir, "py_bindings_all.h")
+    source_includes = ''.join(f'#include "{inc}"\n' for inc in sorted(includes))
+    binding_includes = ''.join(f'#include "{gen_file}"\n' for gen_file in generated_files)
+    calls = ''.join(f"    {call}\n" for call in bind_calls)
+    
+    # Assembled in full and written once
     with open(master_file, 'w') as f:
-        f.write("#pragma once\n")
-        f.write("// Auto-generated master include for all pybind11 bindings\n")
-        f.write("// Generated by generate_bindings.py --recursive\n")
-        f.write("//\n")
-        f.write("// Note: Individual binding files are preserved if they exist.\n")
-        f.write("// Use --force to regenerate all files.\n\n")
-        
-        f.write("#include <pybind11/pybind11.h>\n")
-        f.write("#include <pybind11/stl.h>\n\n")
-        
-        # Include source headers
-        f.write("// Source headers\n")
-        for inc in sorted(includes):
-            f.write(f'#include "{inc}"\n')
-        f.write("\n")
-        
-        # Include generated binding headers
-        f.write("// Generated binding headers\n")
-        for gen_file in generated_files:
-            f.write(f'#include "{gen_file}"\n')
-        f.write("\n")
-        
-        f.write("namespace py = pybind11;\n\n")
-        
-        # Generate the master bind function
-        f.write("/// Call this function to register all bindings\n")
-        f.write("inline void bind_all(py::module_& m) {\n")
-        for call in bind_calls:
-            f.write(f"    {call}\n")
-        f.write("}\n")
+        f.write(
+            "#pragma once\n"
+            "// Auto-generated master include for all pybind11 bindings\n"
+            "// Generated by generate_bindings.py --recursive\n"
+            "//\n"
+            "// Note: Individual binding files are preserved if they exist.\n"
+            "// Use --force to regenerate all files.\n\n"
+            "#include <pybind11/pybind11.h>\n"
+            "#include <pybind11/stl.h>\n\n"
+            # Include source headers
+            "// Source headers\n"
+            f"{source_includes}"
+            "\n"
+            # Include generated binding headers
+            "// Generated binding headers\n"
+            f"{binding_includes}"
+            "\n"
+            "namespace py = pybind11;\n\n"
+            # Generate the master bind function
+            "/// Call this function to register all bindings\n"
+            "inline void bind_all(py::module_& m) {\n"
+            f"{calls}"
+            "}\n"
+        )
     
     print(f"\n  Generated master include: {master_file}")
     print(f"\n=== Summary ===")
@@ -1269,4 +1623,13 @@ inline void bind_{name}(py::module_& m) {{
 
 
 if __name__ == '__main__':
+    # Importing ourselves by name prefers a mypyc-compiled extension sitting
+    # next to this file; without one it simply loads this source again.
+    # It goes through importlib so mypyc does not compile it as an import
+    # of its own module, which it cannot build
+    import importlib
+    try:
+        main = importlib.import_module('generate_bindings').main
+    except ImportError:
+        pass
     exit(main())